@@ -19,7 +19,7 @@ AVAILABLE_TABLE_APPENDERS = {
     "TSVTableAppender": 'TSVTableAppender',
     "LZMATSVTableAppender": 'LZMATSVTableAppender',
     "LZ77TSVTableAppender": 'LZ77TSVTableAppender',
-    #    "ArrowTableAppender": 'ArrowTableAppender', # bugs
+    "ArrowTableAppender": 'ArrowTableAppender',
     "HDF5TableAppender": 'HDF5TableAppender',
     "ParquetTableAppender": 'ParquetTableAppender',
     "SQLite3TableAppender": 'SQLite3TableAppender'
@@ -1,10 +1,12 @@
 """
-Using arrow IPC format with one record per block.
+Using arrow IPC file format with one record batch per buffer.
 
-This application have bugs.
+Schema is inferred from the first batch, and widened if a later batch does not fit,
+e.g., an integer column receiving floats or a column that was all-null in the first batch.
+Widening rewrites what is already written using the new schema, so rows are never dropped.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 
 import pandas as pd
 import pyarrow as pa
@@ -12,16 +14,41 @@ import pyarrow as pa
 from pid_monitor._dt_mvc.appender.typing import TableAppenderConfig, DictBufferAppender
 
 
+def _is_number(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+
+
+def _widen_type(old_type: pa.DataType, new_type: pa.DataType) -> pa.DataType:
+    """
+    Get a type that both types can be cast to without losing values.
+    """
+    if old_type == new_type or pa.types.is_null(new_type):
+        return old_type
+    if pa.types.is_null(old_type):
+        return new_type
+    if _is_number(old_type) and _is_number(new_type):
+        if pa.types.is_floating(old_type) or pa.types.is_floating(new_type):
+            return pa.float64()
+        return pa.int64()
+    return pa.string()
+
+
 class ArrowTableAppender(DictBufferAppender):
+    """
+    Arrow IPC file appender. Columnar, no text formatting on writing.
+    """
     _schema: Optional[pa.Schema]
-    _file_handler: Optional[pa.RecordBatchStreamWriter]
+    _sink: Optional[pa.NativeFile]
+    _file_handler: Optional[pa.RecordBatchFileWriter]
 
     def _get_n_lines_actually_written_hook(self) -> int:
-        return pa.ipc.open_stream(pa.OSFile(self._real_filename)).read_all().to_pandas().shape[0]
+        with pa.OSFile(self._real_filename) as reader:
+            return pa.ipc.open_file(reader).read_all().num_rows
 
     def __init__(self, filename: str, header: List[str], tac: TableAppenderConfig):
         super().__init__(filename, header, tac)
         self._schema = None
+        self._sink = None
         self._file_handler = None
 
     def _get_real_filename_hook(self):
@@ -30,20 +57,49 @@ class ArrowTableAppender(DictBufferAppender):
     def _create_file_hook(self):
         pass
 
-    def _write_hook(self, df: pa.RecordBatch):
+    def _open_writer(self, schema: pa.Schema):
+        self._schema = schema
+        self._sink = pa.OSFile(self._real_filename, mode="w")
+        self._file_handler = pa.ipc.new_file(
+            sink=self._sink,
+            schema=self._schema
+        )
+
+    def _close_writer(self):
+        self._file_handler.close()
+        self._sink.close()
+        self._file_handler = None
+
+    def _widen_schema(self, schema: pa.Schema):
+        """
+        Rewrite written batches using ``schema``.
+        """
+        self._close_writer()
+        with pa.OSFile(self._real_filename) as reader:
+            written_table = pa.ipc.open_file(reader).read_all()
+        self._open_writer(schema)
+        self._file_handler.write_table(written_table.cast(schema))
+
+    def _write_hook(self, df: pd.DataFrame):
+        table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
         if self._schema is None:
-            self._schema = df.schema
-            self._file_handler = pa.ipc.new_stream(
-                sink=pa.OSFile(self._real_filename, mode="w"),
-                schema=df.schema
-            )
-        self._file_handler.write_batch(df)
+            self._open_writer(table.schema)
+        elif table.schema != self._schema:
+            widened_schema = pa.schema([
+                pa.field(field.name, _widen_type(field.type, table.schema.field(field.name).type))
+                for field in self._schema
+            ])
+            if widened_schema != self._schema:
+                self._widen_schema(widened_schema)
+            table = table.cast(self._schema)
+        self._file_handler.write_table(table)
 
-    def flush(self) -> pa.RecordBatch:
-        return pa.record_batch(pd.DataFrame.from_dict(data=self._buff))
+    def flush(self, buff: Dict[str, List[Any]]) -> pd.DataFrame:
+        return pd.DataFrame.from_dict(data=buff)
 
     def close(self):
         super(ArrowTableAppender, self).close()
         if self._file_handler is None:
             return
-        self._file_handler.close()
+        with self._write_mutex:
+            self._close_writer()
@@ -1,17 +1,18 @@
 import lzma
+from typing import IO
 
 from pid_monitor._dt_mvc.appender.tsv_appender import TSVTableAppender
 
 
 class LZMATSVTableAppender(TSVTableAppender):
+    """
+    Compressed stream is opened on each write, appending a new member,
+    so that the file is readable after an unclean exit.
+    """
+    _keep_open = False
 
     def _get_real_filename_hook(self):
         self._real_filename = ".".join((self.filename, "tsv", "xz"))
 
-    def _create_file_hook(self):
-        with lzma.open(self._real_filename, mode="wt") as writer:
-            writer.write("\t".join(self.header) + "\n")
-
-    def _write_hook(self, df: str):
-        with lzma.open(self._real_filename, mode="at") as writer:
-            writer.write(df)
+    def _open_hook(self, mode: str) -> IO[str]:
+        return lzma.open(self._real_filename, mode=mode)
@@ -1,26 +1,91 @@
+import collections
+import os
+import threading
+from typing import Dict, List, Any, Optional, IO
+
 import pandas as pd
 
-from pid_monitor._dt_mvc.appender.typing import DictBufferAppender
+from pid_monitor._dt_mvc.appender.typing import DictBufferAppender, TableAppenderConfig
+
+_WRITE_BUFFER_SIZE = 1 << 16
+
+_MAX_OPEN_WRITERS = 64
+"""Maximum number of files kept open by all :py:class:`TSVTableAppender`, least recently written ones are closed first"""
+
+_OPEN_WRITERS: "collections.OrderedDict[TSVTableAppender, None]" = collections.OrderedDict()
+_OPEN_WRITERS_MUTEX = threading.Lock()
+"""Guards :py:data:`_OPEN_WRITERS` and file handles inside"""
 
 
 class TSVTableAppender(DictBufferAppender):
+    """
+    Tab-separated values appender.
+
+    The file is kept open between writes, and each write is flushed to the kernel,
+    so that written lines survive an unclean exit.
+    At most :py:data:`_MAX_OPEN_WRITERS` files are kept open at the same time.
+
+    A forked process (e.g., in the benchmark) opens the file on each write instead,
+    so that it never touches buffers of the parent.
+    """
+    _keep_open: bool = True
+    """Whether to keep the file open between writes. Compressed subclasses set this to :py:obj:`False`"""
+
+    _writer: Optional[IO[str]]
+    _writer_pid: int
+
+    def __init__(self, filename: str, header: List[str], tac: TableAppenderConfig):
+        self._writer = None
+        self._writer_pid = os.getpid()
+        super().__init__(filename, header, tac)
 
     def _get_real_filename_hook(self):
         self._real_filename = ".".join((self.filename, "tsv"))
 
-    def flush(self) -> str:
+    def _open_hook(self, mode: str) -> IO[str]:
+        return open(self._real_filename, mode=mode, buffering=_WRITE_BUFFER_SIZE)
+
+    def flush(self, buff: Dict[str, List[Any]]) -> str:
         return "\n".join(map(
             lambda x: "\t".join(map(repr, x)),  # x is [COLUMN]
-            zip(*self._buff.values())
+            zip(*buff.values())
         )) + "\n"
 
     def _create_file_hook(self):
-        with open(self._real_filename, mode="wt") as writer:
+        with self._open_hook("wt") as writer:
             writer.write("\t".join(self.header) + "\n")
 
     def _write_hook(self, df: str):
-        with open(self._real_filename, mode="at") as writer:
-            writer.write(df)
+        if not self._keep_open or os.getpid() != self._writer_pid:
+            with self._open_hook("at") as writer:
+                writer.write(df)
+            return
+        with _OPEN_WRITERS_MUTEX:
+            if self._writer is None:
+                while len(_OPEN_WRITERS) >= _MAX_OPEN_WRITERS:
+                    _OPEN_WRITERS.popitem(last=False)[0]._close_writer()
+                self._writer = self._open_hook("at")
+                _OPEN_WRITERS[self] = None
+            else:
+                _OPEN_WRITERS.move_to_end(self)
+            self._writer.write(df)
+            self._writer.flush()
+
+    def _close_writer(self):
+        """
+        Close the kept file handle. Should be called with :py:data:`_OPEN_WRITERS_MUTEX` held.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self):
+        super().close()
+        if os.getpid() != self._writer_pid:
+            return
+        with _OPEN_WRITERS_MUTEX:
+            _OPEN_WRITERS.pop(self, None)
+            self._close_writer()
 
     def _get_n_lines_actually_written_hook(self) -> int:
         return pd.read_table(self._real_filename, sep="\t", engine="pyarrow").shape[0]
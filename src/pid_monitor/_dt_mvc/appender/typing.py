@@ -1,10 +1,126 @@
+import atexit
+import itertools
+import logging
 import multiprocessing
 import os
+import threading
 from abc import abstractmethod, ABC
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Callable, Optional, Tuple, Iterator
 
 import pandas as pd
 
+_WRITER_RING_SIZE = 65536
+"""Number of slots in the ring of writer thread. Producers block when it is full"""
+
+
+class _WriterThread(threading.Thread):
+    """
+    The single thread that performs all disk writes of this process,
+    so that probing threads only need to enqueue their data.
+
+    Queued items are ``(write_function, payload)`` and are executed in FIFO order.
+    They are stored in a pre-allocated ring of :py:data:`_WRITER_RING_SIZE` slots.
+    A producer reserves a slot by taking the next sequence number from :py:func:`itertools.count`,
+    which is atomic in CPython, so producers do not take any lock unless the ring is full.
+    """
+
+    _ring: List[Optional[Tuple[Callable[[Any], None], Any]]]
+    _sequence: Iterator[int]
+    _consumed: int
+    """Number of items taken out of the ring"""
+    _has_items: threading.Event
+    _not_full: threading.Condition
+    _n_blocked_producers: int
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._ring = [None] * _WRITER_RING_SIZE
+        self._sequence = itertools.count()
+        self._consumed = 0
+        self._has_items = threading.Event()
+        self._not_full = threading.Condition()
+        self._n_blocked_producers = 0
+
+    def put(self, item: Tuple[Callable[[Any], None], Any]):
+        sequence = next(self._sequence)
+        if sequence - self._consumed >= _WRITER_RING_SIZE:
+            with self._not_full:
+                self._n_blocked_producers += 1
+                while sequence - self._consumed >= _WRITER_RING_SIZE:
+                    self._not_full.wait()
+                self._n_blocked_producers -= 1
+        self._ring[sequence % _WRITER_RING_SIZE] = item
+        self._has_items.set()
+
+    def _get(self) -> Tuple[Callable[[Any], None], Any]:
+        slot = self._consumed % _WRITER_RING_SIZE
+        while True:
+            item = self._ring[slot]
+            if item is not None:
+                break
+            self._has_items.clear()
+            if self._ring[slot] is None:  # Producers set the event after filling their slot
+                self._has_items.wait()
+        self._ring[slot] = None
+        self._consumed += 1
+        if self._n_blocked_producers:
+            with self._not_full:
+                self._not_full.notify_all()
+        return item
+
+    def run(self):
+        while True:
+            write_function, payload = self._get()
+            try:
+                write_function(payload)
+            except Exception as e:
+                logging.getLogger().error(
+                    f"Writer: {e.__class__.__name__} encountered! DETAILS={e.__repr__()}"
+                )
+
+
+_WRITER: Optional[_WriterThread] = None
+_WRITER_PID: int = -1
+_WRITER_MUTEX = threading.Lock()
+"""Only used when creating the writer"""
+
+
+def _get_writer() -> _WriterThread:
+    """
+    Get writer of current process. A new one is created after :py:func:`os.fork`.
+    """
+    global _WRITER, _WRITER_PID
+    writer = _WRITER
+    if writer is not None and _WRITER_PID == os.getpid():
+        return writer
+    with _WRITER_MUTEX:
+        if _WRITER is None or _WRITER_PID != os.getpid():
+            _WRITER = _WriterThread()
+            _WRITER_PID = os.getpid()
+            _WRITER.start()
+        return _WRITER
+
+
+def submit_write(write_function: Callable[[Any], None], payload: Any) -> None:
+    """
+    Ask the writer thread to call ``write_function(payload)``.
+    """
+    _get_writer().put((write_function, payload))
+
+
+def wait_for_writes() -> None:
+    """
+    Block until all writes submitted before this call are finished.
+    """
+    if _WRITER is None or _WRITER_PID != os.getpid():
+        return
+    finished = threading.Event()
+    submit_write(lambda _: finished.set(), None)
+    finished.wait()
+
+
+atexit.register(wait_for_writes)
+
 
 class TableAppenderConfig:
     buffer_size: int
@@ -88,17 +204,26 @@ class DictBufferAppender(BaseTableAppender, ABC):
                 for header_item, body_item in zip(self.header, body):
                     self._buff[header_item].append(body_item)
             if len(self) == self._tac.buffer_size:
-                df = self.flush()
+                submit_write(self._flush_and_write, self._buff)
                 self._buff = {}
-                with self._write_mutex:
-                    self._write_hook(df)
+
+    def _flush_and_write(self, buff: Dict[str, List[Any]]):
+        """
+        Executed in writer thread.
+        """
+        df = self.flush(buff)
+        with self._write_mutex:
+            self._write_hook(df)
 
     @abstractmethod
     def _write_hook(self, df: Any):
         pass
 
     @abstractmethod
-    def flush(self) -> Any:
+    def flush(self, buff: Dict[str, List[Any]]) -> Any:
+        """
+        Convert a buffer to format accepted by :py:func:`_write_hook`.
+        """
         pass
 
     def __len__(self):
@@ -107,18 +232,17 @@ class DictBufferAppender(BaseTableAppender, ABC):
         return len(self._buff[self._h0])
 
     def close(self):
-        if len(self) == 0:
-            return
-        df = self.flush()
-        self._buff = {}
-        with self._write_mutex:
-            self._write_hook(df)
+        with self._buff_mutex:
+            if len(self) != 0:
+                submit_write(self._flush_and_write, self._buff)
+                self._buff = {}
+        wait_for_writes()
 
 
 class PandasDictBufferAppender(DictBufferAppender, ABC):
 
-    def flush(self) -> pd.DataFrame:
-        df = pd.DataFrame.from_dict(data=self._buff)
+    def flush(self, buff: Dict[str, List[Any]]) -> pd.DataFrame:
+        df = pd.DataFrame.from_dict(data=buff)
         return df
 
     @abstractmethod
@@ -0,0 +1,152 @@
+"""
+fastproc -- Cached reader of ``/proc/[pid]/stat``
+
+Tracers of the same process share one read of ``/proc/[pid]/stat`` per tick,
+instead of letting each :py:mod:`psutil` accessor re-read it.
+
+Also provides a ``ppid -> [pids]`` map built from one scan of ``/proc``,
+shared by all dispatchers.
+
+Field indexes follow ``proc(5)``.
+"""
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import Dict, Tuple, List
+
+import psutil
+
+__all__ = ("ProcStat", "read_stat", "get_stat", "forget", "status_name", "get_children")
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+_STATUS_NAMES = {
+    "R": "running",
+    "S": "sleeping",
+    "D": "disk-sleep",
+    "T": "stopped",
+    "t": "tracing-stop",
+    "Z": "zombie",
+    "X": "dead",
+    "x": "dead",
+    "K": "wake-kill",
+    "W": "waking",
+    "I": "idle",
+    "P": "parked"
+}
+"""Same as what :py:func:`psutil.Process.status` returns"""
+
+ProcStat = namedtuple("ProcStat", ("utime", "stime", "num_threads", "state"))
+"""utime and stime in seconds, state in single letter"""
+
+_SNAPSHOTS: Dict[int, Tuple[float, ProcStat]] = {}
+"""Dict[pid, (monotonic time of reading, stat)]"""
+
+_PROC_SNAPSHOT_MAX_AGE = 0.2
+"""Re-scan ``/proc`` for children if the snapshot is older than this number of seconds"""
+
+_PROC_SNAPSHOT_LOCK = threading.Lock()
+_PROC_SNAPSHOT = {"ts": -_PROC_SNAPSHOT_MAX_AGE, "children": {}, "finished": set()}
+"""
+Monotonic time of the last scan, Dict[ppid, List[pid]] of that scan,
+and PIDs forgotten since that scan, which are hidden from :py:func:`get_children` until next scan.
+"""
+
+
+def read_stat(pid: int) -> ProcStat:
+    """
+    Read ``/proc/[pid]/stat``.
+
+    :raise psutil.NoSuchProcess: If the process does not exist.
+    :raise psutil.AccessDenied: If permission denied.
+    :raise psutil.Error: On other :py:class:`OSError`, e.g., too many open files.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as reader:
+            stat_bytes = reader.read()
+    except (FileNotFoundError, ProcessLookupError):
+        raise psutil.NoSuchProcess(pid)
+    except PermissionError:
+        raise psutil.AccessDenied(pid)
+    except OSError as e:
+        raise psutil.Error(f"Failed to read /proc/{pid}/stat: {e}") from e
+    # Process name may contain spaces or brackets, so split after the last ')'.
+    parts = stat_bytes[stat_bytes.rindex(b')') + 2:].split()
+    return ProcStat(
+        utime=int(parts[11]) / _CLOCK_TICKS,
+        stime=int(parts[12]) / _CLOCK_TICKS,
+        num_threads=int(parts[17]),
+        state=parts[0].decode()
+    )
+
+
+def get_stat(pid: int, max_age: float) -> ProcStat:
+    """
+    Get stat of a process, re-reading ``/proc/[pid]/stat`` only if cached one is older than ``max_age`` seconds.
+    """
+    now = time.monotonic()
+    try:
+        read_time, stat = _SNAPSHOTS[pid]
+        if now - read_time < max_age:
+            return stat
+    except KeyError:
+        pass
+    stat = read_stat(pid)
+    _SNAPSHOTS[pid] = (now, stat)
+    return stat
+
+
+def forget(pid: int) -> None:
+    """
+    Remove cached stat of a process, and hide it from :py:func:`get_children` until ``/proc`` is scanned again.
+    Called when tracing of the process is finished.
+    """
+    _SNAPSHOTS.pop(pid, None)
+    with _PROC_SNAPSHOT_LOCK:
+        _PROC_SNAPSHOT["finished"].add(pid)
+
+
+def status_name(state: str) -> str:
+    return _STATUS_NAMES.get(state, "?")
+
+
+def _scan_children() -> Dict[int, List[int]]:
+    """
+    :raise psutil.Error: On :py:class:`OSError` other than process exited or permission denied,
+        so that children are never silently missed.
+    """
+    children = {}
+    try:
+        entries = list(os.scandir("/proc"))
+    except OSError as e:
+        raise psutil.Error(f"Failed to scan /proc: {e}") from e
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry.name}/stat", "rb") as reader:
+                stat_bytes = reader.read()
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+        except OSError as e:
+            raise psutil.Error(f"Failed to read /proc/{entry.name}/stat: {e}") from e
+        ppid = int(stat_bytes[stat_bytes.rindex(b')') + 2:].split(maxsplit=2)[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+    return children
+
+
+def get_children(ppid: int) -> Tuple[int, ...]:
+    """
+    Get PIDs of direct child processes, from a ``/proc`` scan not older than 200 ms.
+
+    :raise psutil.Error: If ``/proc`` cannot be scanned.
+    """
+    with _PROC_SNAPSHOT_LOCK:
+        now = time.monotonic()
+        if now - _PROC_SNAPSHOT["ts"] >= _PROC_SNAPSHOT_MAX_AGE:
+            _PROC_SNAPSHOT["children"] = _scan_children()
+            _PROC_SNAPSHOT["finished"] = set()
+            _PROC_SNAPSHOT["ts"] = now
+        finished = _PROC_SNAPSHOT["finished"]
+        return tuple(pid for pid in _PROC_SNAPSHOT["children"].get(ppid, ()) if pid not in finished)
@@ -1,3 +1,9 @@
+import math
+
+_BINARY_PREFIXES = ('', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei')
+_DECIMAL_PREFIXES = ('', 'K', 'M', 'G', 'T', 'P', 'E')
+
+
 def to_human_readable(
         num: int,
         base: int = 1024,
@@ -5,20 +11,27 @@ def to_human_readable(
 ) -> str:
     """
     Make an integer to 1000- or 1024-based human-readable form.
+
+    A prefix is used only if ``num`` is strictly larger than ``base`` to the power of it,
+    so 1024 is shown as ``1024.00B``.
     """
     if base == 1024:
-        dc_list = ['', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei']
+        dc_list = _BINARY_PREFIXES
     elif base == 1000:
-        dc_list = ['', 'K', 'M', 'G', 'T', 'P', 'E']
+        dc_list = _DECIMAL_PREFIXES
     else:
         raise ValueError("base should be 1000 or 1024")
-    step = 0
-    dc = dc_list[step]
-    while num > base and step < len(dc_list) - 1:
-        step = step + 1
-        num /= base
-        dc = dc_list[step]
-    return f"{num:.2f}{dc}{suffix}"
+    if num <= base:
+        return f"{num:.2f}{suffix}"
+    if base == 1024:
+        # Index of highest set bit of (num - 1), in steps of 10 bits
+        step = (math.ceil(num) - 1).bit_length() - 1
+        step = min(step // 10, len(dc_list) - 1)
+        return f"{num / (1 << (step * 10)):.2f}{dc_list[step]}{suffix}"
+    step = min(int(math.log10(num) // 3), len(dc_list) - 1)
+    if num <= 1000 ** step:  # Exact powers of 1000
+        step -= 1
+    return f"{num / 1000 ** step:.2f}{dc_list[step]}{suffix}"
 
 
 def percent_to_str(num: float, total: float) -> str:
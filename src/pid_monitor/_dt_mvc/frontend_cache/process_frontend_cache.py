@@ -4,6 +4,21 @@ from pid_monitor._dt_mvc.frontend_cache import percent_to_str, to_human_readable
 
 
 class ProcessFrontendCache:
+    """
+    Values shown in frontend for a process. Uses ``__slots__`` since tracers write to it on each probe.
+    """
+    __slots__ = (
+        "pid",
+        "ppid",
+        "name",
+        "cpu_percent",
+        "stat",
+        "cpu_time",
+        "resident_mem",
+        "num_threads",
+        "num_child_processes"
+    )
+
     pid: int
     ppid: int
     name: str
@@ -34,17 +49,17 @@ class ProcessFrontendCache:
         self.ppid = ppid
 
     def to_prettytable_row(self) -> List[str]:
-        return list(map(
-            lambda x: repr(x).replace('\'', '').replace('\"', ''),
-            (
-                self.pid,
-                self.ppid,
-                self.name,
-                self.stat,
-                percent_to_str(self.cpu_percent, 100),
-                f"{self.cpu_time:.2f}",
-                to_human_readable(self.resident_mem),
-                self.num_threads,
-                self.num_child_processes
-            )
-        ))
+        """
+        Format cached values. Only called when the frontend is rendered.
+        """
+        return [
+            str(self.pid),
+            str(self.ppid),
+            str(self.name),
+            str(self.stat),
+            percent_to_str(self.cpu_percent, 100),
+            f"{self.cpu_time:.2f}",
+            to_human_readable(self.resident_mem),
+            str(self.num_threads),
+            str(self.num_child_processes)
+        ]
@@ -1,9 +1,40 @@
 import argparse
 import os
-from typing import List
+from typing import List, Optional
 
 from pid_monitor._dt_mvc.appender import AVAILABLE_TABLE_APPENDERS
 
+
+def _get_default_monitor_cpu() -> Optional[int]:
+    """
+    Last logical core allowed for this process, or ``None`` if CPU affinity is not supported.
+    """
+    try:
+        return max(os.sched_getaffinity(0))
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _validate_cpu_poll_indices(cpu_poll_indices: List[int]):
+    """
+    :raise ValueError: If the list is empty or contains indices that are not logical cores of this host.
+    """
+    if not cpu_poll_indices:
+        raise ValueError("cpu_poll_indices should contain at least one logical core!")
+    n_cpus = os.cpu_count()
+    if n_cpus is None:
+        return
+    unknown_indices = sorted(set(
+        index for index in cpu_poll_indices
+        if not 0 <= index < n_cpus
+    ))
+    if unknown_indices:
+        raise ValueError(
+            f"cpu_poll_indices {unknown_indices} are not logical cores! "
+            f"Available: 0-{n_cpus - 1}"
+        )
+
+
 DEFAULT_BACKEND_REFRESH_INTERVAL = 0.01
 DEFAULT_FRONTEND_REFRESH_INTERVAL = 1
 DEFAULT_PROCESS_LEVEL_TRACERS = [
@@ -24,6 +55,7 @@ DEFAULT_SYSTEM_LEVEL_TRACERS = [
 ]
 DEFAULT_TABLE_APPENDER = "LZ77TSVTableAppender"
 DEFAULT_TABLE_APPENDER_BUFFER_SIZE = 16
+DEFAULT_MONITOR_CPU = _get_default_monitor_cpu()
 POSSIBLE_TRACER_PATHS = (
     "pid_monitor._dt_mvc.std_tracer.process_child_tracer_thread",
     "pid_monitor._dt_mvc.std_tracer.process_cpu_tracer_thread",
@@ -49,6 +81,20 @@ class PMConfig:
     frontend_refresh_interval: float
     table_appender_type: str
     toplevel_trace_pid: int
+    cpu_poll_indices: Optional[List[int]]
+    """
+    Logical cores whose utilization is written by system-level CPU tracer. ``None`` for all cores.
+
+    Polling fewer cores makes each system CPU probe cheaper on hosts with many cores,
+    at the cost of losing per-core details of unpolled cores.
+    Utilization shown in frontend is always calculated over all cores.
+    """
+    monitor_cpu: Optional[int]
+    """
+    Logical core that all monitor threads are pinned to, so that they perturb the traced process less.
+    For best results, pin the traced process to other cores, e.g., using ``taskset``.
+    ``None`` or negative values disable pinning.
+    """
 
     def __init__(
             self,
@@ -59,7 +105,9 @@ class PMConfig:
             process_level_tracer_to_load=None,
             frontend_refresh_interval: float = DEFAULT_FRONTEND_REFRESH_INTERVAL,
             table_appender_type: str = DEFAULT_TABLE_APPENDER,
-            table_appender_buffer_size: int = DEFAULT_TABLE_APPENDER_BUFFER_SIZE
+            table_appender_buffer_size: int = DEFAULT_TABLE_APPENDER_BUFFER_SIZE,
+            cpu_poll_indices: Optional[List[int]] = None,
+            monitor_cpu: Optional[int] = DEFAULT_MONITOR_CPU
     ):
         if output_basename is None:
             os.makedirs(f"pid_monitor_{toplevel_trace_pid}", exist_ok=True)
@@ -76,6 +124,10 @@ class PMConfig:
         self.frontend_refresh_interval = frontend_refresh_interval
         self.table_appender_type = table_appender_type
         self.table_appender_buffer_size = table_appender_buffer_size
+        if cpu_poll_indices is not None:
+            _validate_cpu_poll_indices(cpu_poll_indices)
+        self.cpu_poll_indices = cpu_poll_indices
+        self.monitor_cpu = monitor_cpu
 
     @classmethod
     def from_args(
@@ -98,7 +150,9 @@ class PMConfig:
             system_level_tracers_to_load=parsed_args.system_level_tracers_to_load,
             process_level_tracer_to_load=parsed_args.process_level_tracer_to_load,
             table_appender_type=parsed_args.table_appender_type,
-            table_appender_buffer_size=parsed_args.table_appender_buffer_size
+            table_appender_buffer_size=parsed_args.table_appender_buffer_size,
+            cpu_poll_indices=parsed_args.cpu_poll_indices,
+            monitor_cpu=parsed_args.monitor_cpu
         )
         return newinstance
 
@@ -162,5 +216,22 @@ class PMConfig:
             required=False,
             default=DEFAULT_TABLE_APPENDER_BUFFER_SIZE
         )
+        parser.add_argument(
+            "--cpu_poll_indices",
+            help="Manually specify logical cores traced by system-level CPU tracer. "
+                 "Tracing fewer cores reduces probing cost on many-core hosts",
+            type=int,
+            required=False,
+            nargs='*',
+            default=None
+        )
+        parser.add_argument(
+            "--monitor_cpu",
+            help="Manually specify the logical core that monitor threads are pinned to. "
+                 "Use a negative value to disable pinning",
+            type=int,
+            required=False,
+            default=DEFAULT_MONITOR_CPU
+        )
 
         return parser
@@ -16,6 +16,7 @@ from pid_monitor._dt_mvc.frontend_cache.system_frontend_cache import SystemFront
 from pid_monitor._dt_mvc.pm_config import PMConfig, POSSIBLE_TRACER_PATHS
 from pid_monitor._dt_mvc.std_tracer import BaseTracerThread
 from pid_monitor._dt_mvc.typing import ThreadWithPMC
+from pid_monitor._lib.interval_timer import IntervalTimer
 
 _PROCESS_TABLE_COL_NAMES = (
     'PID',
@@ -89,6 +90,7 @@ class BaseTracerDispatcherThread(ThreadWithPMC):
         pass
 
     def run(self):
+        self.pin_to_monitor_cpu()
         self.log_handler.info(f"Dispatcher for trace_pid={self.trace_pid} started")
         self.run_body()
         self.log_handler.info(f"Dispatcher for trace_pid={self.trace_pid} stopped")
@@ -97,8 +99,9 @@ class BaseTracerDispatcherThread(ThreadWithPMC):
         """
         The default runner
         """
-        while not self.should_exit:
-            time.sleep(self.pmc.backend_refresh_interval)
+        with IntervalTimer(self.pmc.backend_refresh_interval) as timer:
+            while not self.should_exit:
+                timer.wait()
 
     def __del__(self):
         """
@@ -173,6 +176,12 @@ class DispatcherController:
     def get_current_active_pids(self) -> List[int]:
         return list(self._dispatchers.keys())
 
+    def has_dispatcher(self, pid: int) -> bool:
+        """
+        Whether a dispatcher is active for ``pid``. Cheaper than :py:func:`get_current_active_pids`.
+        """
+        return pid in self._dispatchers
+
     def register_dispatcher(self, dispatcher: BaseTracerDispatcherThread) -> None:
         self._dispatchers[dispatcher.trace_pid] = dispatcher
         self.all_pids.add(dispatcher.trace_pid)
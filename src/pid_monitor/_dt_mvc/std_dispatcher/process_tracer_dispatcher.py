@@ -1,20 +1,17 @@
 from __future__ import annotations
 
 import threading
-from time import sleep
 from typing import Optional
 
 import psutil
 
-from pid_monitor._dt_mvc import PSUTIL_NOTFOUND_ERRORS
+from pid_monitor._dt_mvc import PSUTIL_NOTFOUND_ERRORS, fastproc
 from pid_monitor._dt_mvc.appender import BaseTableAppender, load_table_appender_class
 from pid_monitor._dt_mvc.appender.typing import TableAppenderConfig
 from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
 from pid_monitor._dt_mvc.std_dispatcher import BaseTracerDispatcherThread, DispatcherController
-
-_REG_MUTEX = threading.Lock()
-"""Mutex for writing registries"""
+from pid_monitor._lib.interval_timer import IntervalTimer
 
 _DISPATCHER_MUTEX = threading.Lock()
 """Mutex for creating dispatchers for new process/thread"""
@@ -29,7 +26,7 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
     """
 
     def before_ending(self):
-        pass
+        fastproc.forget(self.trace_pid)
 
     _registry_appender: BaseTableAppender
     process: Optional[psutil.Process]
@@ -47,8 +44,7 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
         - Detect whether this process exists. If not exists, will raise an error.
         - Add PID to all recorded PIDS.
         - Write system-level registry.
-        - Write initializing environment variables of this process.
-        - Write mapfile information.
+        - Write initializing environment variables of this process and mapfile information in background.
         - Start load_tracers.
         """
         super().__init__(
@@ -72,11 +68,12 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
             name = self.process.name()
             ppid = self.process.ppid()
             self._write_registry()
-            self._write_env()
-            self._write_mapfile()
         except PSUTIL_NOTFOUND_ERRORS as e:
             self.log_handler.error(f"DISPATCHEE={self.trace_pid}: {e.__class__.__name__} encountered!")
-            self._dispatcher_controller.remove_dispatcher(self.trace_pid)
+            self.sigterm()
+            return
+        except OSError as e:
+            self.log_handler.error(f"DISPATCHEE={self.trace_pid}: OSError encountered! DETAILS={e.__repr__()}")
             self.sigterm()
             return
 
@@ -89,22 +86,32 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
             self.trace_pid,
             self._frontend_cache
         )
+        threading.Thread(target=self._write_env_and_mapfile, daemon=True).start()
         try:
             self.start_tracers(
                 self.pmc.process_level_tracer_to_load
             )
         except PSUTIL_NOTFOUND_ERRORS as e:
             self.log_handler.error(f"DISPATCHEE={self.trace_pid}: {e.__class__.__name__} encountered!")
-            self._dispatcher_controller.remove_dispatcher(self.trace_pid)
             self.sigterm()
             return
-        while not self.should_exit:
-            try:
-                with _DISPATCHER_MUTEX:
-                    self._detect_process()
-            except PSUTIL_NOTFOUND_ERRORS:
-                break
-            sleep(self.pmc.backend_refresh_interval)
+        except OSError as e:
+            self.log_handler.error(f"DISPATCHEE={self.trace_pid}: OSError encountered! DETAILS={e.__repr__()}")
+            self.sigterm()
+            return
+        with IntervalTimer(self.pmc.backend_refresh_interval) as timer:
+            while not self.should_exit:
+                try:
+                    with _DISPATCHER_MUTEX:
+                        self._detect_process()
+                except PSUTIL_NOTFOUND_ERRORS:
+                    break
+                except OSError as e:
+                    self.log_handler.error(
+                        f"DISPATCHEE={self.trace_pid}: OSError encountered! DETAILS={e.__repr__()}"
+                    )
+                    break
+                timer.wait()
         self.sigterm()
 
     def _write_registry(self):
@@ -126,6 +133,24 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
         ])
         self.log_handler.debug(f"DISPATCHEE={self.trace_pid}: writing registry SUCCESS")
 
+    def _write_env_and_mapfile(self):
+        """
+        Background job writing environment variables and mapfile,
+        which may be large and should not delay starting of tracers.
+        """
+        try:
+            self._write_env()
+            self._write_mapfile()
+        except PSUTIL_NOTFOUND_ERRORS as e:
+            self.log_handler.warning(
+                f"DISPATCHEE={self.trace_pid}: {e.__class__.__name__} encountered when writing ENV and MAPFILE!"
+            )
+        except OSError as e:
+            self.log_handler.warning(
+                f"DISPATCHEE={self.trace_pid}: OSError encountered when writing ENV and MAPFILE! "
+                f"DETAILS={e.__repr__()}"
+            )
+
     def _write_env(self):
         """
         Write initializing environment variables.
@@ -174,12 +199,13 @@ class ProcessTracerDispatcherThread(BaseTracerDispatcherThread):
         Detect and start child process dispatcher.
         """
         self.log_handler.debug(f"DISPATCHEE={self.trace_pid}: DETECT PROCESS")
-        for process in self.process.children():
-            if process.pid not in self._dispatcher_controller.get_current_active_pids():
+        fastproc.get_stat(self.trace_pid, self.pmc.backend_refresh_interval)  # Raise if process is gone
+        for child_pid in fastproc.get_children(self.trace_pid):
+            if not self._dispatcher_controller.has_dispatcher(child_pid):
                 self.log_handler.info(
-                    f"DISPATCHEE={self.trace_pid}: DETECT PROCESS: Sub-process {process.pid} detected.")
+                    f"DISPATCHEE={self.trace_pid}: DETECT PROCESS: Sub-process {child_pid} detected.")
                 new_thread = ProcessTracerDispatcherThread(
-                    trace_pid=process.pid,
+                    trace_pid=child_pid,
                     pmc=self.pmc,
                     dispatcher_controller=self._dispatcher_controller,
                     registry_appender=self._registry_appender
@@ -8,7 +8,6 @@ Other tracers that may depend on third-party libraries or software is located in
 under :py:mod:`additional_tracer`.
 """
 from abc import abstractmethod, ABC
-from time import sleep
 from typing import Union, Optional, List
 
 import psutil
@@ -20,6 +19,7 @@ from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFro
 from pid_monitor._dt_mvc.frontend_cache.system_frontend_cache import SystemFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
 from pid_monitor._dt_mvc.typing import ThreadWithPMC
+from pid_monitor._lib.interval_timer import IntervalTimer
 
 
 class ProbeError(ValueError):
@@ -35,6 +35,9 @@ class BaseTracerThread(ThreadWithPMC):
 
     _appender: Optional[BaseTableAppender]
 
+    probe_interval: float
+    """Interval between two probes. Defaults to backend refresh interval."""
+
     def _init_setup_hook(
             self,
             tracer_type: str,
@@ -71,29 +74,42 @@ class BaseTracerThread(ThreadWithPMC):
     ):
         super().__init__(pmc=pmc, trace_pid=trace_pid)
         self.frontend_cache = frontend_cache
+        self.probe_interval = self.pmc.backend_refresh_interval
 
     def run(self):
+        self.pin_to_monitor_cpu()
         self.log_handler.debug(f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} started")
         self.run_body()
         self.log_handler.debug(f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} stopped")
 
     def run_body(self):
-        while not self.should_exit:
-            try:
-                self.log_handler.debug(f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} PROBE")
-                self.probe()
-                self.log_handler.debug(f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} PROBE FIN")
-            except ProbeError as e:
-                self.log_handler.error(
-                    f"TRACE_PID={self.trace_pid} TYPE={self.tracer_type}: ProbeError {e.__class__.__name__} encountered!"
-                )
-                return
-            except PSUTIL_NOTFOUND_ERRORS as e:
-                self.log_handler.error(
-                    f"TRACE_PID={self.trace_pid} TYPE={self.tracer_type}: PSUtilError {e.__class__.__name__} encountered!"
-                )
-                return
-            sleep(self.pmc.backend_refresh_interval)
+        with IntervalTimer(self.probe_interval) as timer:
+            while not self.should_exit:
+                try:
+                    self.log_handler.debug(f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} PROBE")
+                    self.probe()
+                    self.log_handler.debug(
+                        f"Tracer for TRACE_PID={self.trace_pid} TYPE={self.tracer_type} PROBE FIN"
+                    )
+                except ProbeError as e:
+                    self.log_handler.error(
+                        f"TRACE_PID={self.trace_pid} TYPE={self.tracer_type}: "
+                        f"ProbeError {e.__class__.__name__} encountered!"
+                    )
+                    break
+                except PSUTIL_NOTFOUND_ERRORS as e:
+                    self.log_handler.error(
+                        f"TRACE_PID={self.trace_pid} TYPE={self.tracer_type}: "
+                        f"PSUtilError {e.__class__.__name__} encountered!"
+                    )
+                    break
+                except OSError as e:
+                    self.log_handler.error(
+                        f"TRACE_PID={self.trace_pid} TYPE={self.tracer_type}: "
+                        f"OSError encountered! DETAILS={e.__repr__()}"
+                    )
+                    break
+                timer.wait()
         try:
             self._appender.close()
         except AttributeError:
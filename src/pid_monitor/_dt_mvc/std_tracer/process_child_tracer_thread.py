@@ -1,3 +1,4 @@
+from pid_monitor._dt_mvc.fastproc import get_stat, get_children
 from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
 from pid_monitor._dt_mvc.std_tracer import BaseProcessTracerThread
@@ -31,8 +32,8 @@ class ProcessChildTracerThread(BaseProcessTracerThread):
         )
 
     def probe(self):
-        self.frontend_cache.num_child_processes = len(self._process.children())
-        self.frontend_cache.num_threads = len(self._process.threads())
+        self.frontend_cache.num_child_processes = len(get_children(self.trace_pid))
+        self.frontend_cache.num_threads = get_stat(self.trace_pid, self.pmc.backend_refresh_interval).num_threads
         self._appender.append([
             self.get_timestamp(),
             self.frontend_cache.num_child_processes,
@@ -30,6 +30,8 @@ class AsyncProcessCPUProbeThread(threading.Thread):
             on_cpu = self.process.cpu_num()
         except PSUTIL_NOTFOUND_ERRORS:
             return
+        except OSError:
+            return
         self.frontend_cache.cpu_percent = cpu_percent
         self.appender.append([
             time.time(),  # FIXME: Replace with get_timestamp()
@@ -1,8 +1,6 @@
-import sys
-
-import psutil
-
 from pid_monitor._dt_mvc import PSUTIL_NOTFOUND_ERRORS
+from pid_monitor._dt_mvc.appender.typing import submit_write
+from pid_monitor._dt_mvc.fastproc import get_stat
 from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
 from pid_monitor._dt_mvc.std_tracer import BaseProcessTracerThread
@@ -10,14 +8,16 @@ from pid_monitor._dt_mvc.std_tracer import BaseProcessTracerThread
 __all__ = ("ProcessCPUTimeTracerThread",)
 
 
-def get_total_cpu_time(_p: psutil.Process) -> float:
+def get_total_cpu_time(pid: int, max_age: float = 0) -> float:
     """
     Get total CPU time for a process.
     Should return time spent in system mode (aka. kernel mode) and user mode.
+
+    :param max_age: See :py:func:`get_stat`.
     """
     try:
-        cpu_time_tuple = _p.cpu_times()
-        return cpu_time_tuple.system + cpu_time_tuple.user
+        stat = get_stat(pid, max_age)
+        return stat.stime + stat.utime
     except PSUTIL_NOTFOUND_ERRORS:
         return -1
 
@@ -49,12 +49,18 @@ class ProcessCPUTimeTracerThread(BaseProcessTracerThread):
 
     def probe(self):
         self.log_handler.debug(f"DISPATCHEE={self.trace_pid}: update CPUTIME")
-        lct = get_total_cpu_time(self._process)
+        lct = get_total_cpu_time(self.trace_pid, self.pmc.backend_refresh_interval)
         if lct == -1:
             pass
         else:
             self._cached_last_cpu_time = lct
         self.frontend_cache.cpu_time = self._cached_last_cpu_time
-        with open(self._cputime_filename, 'w') as writer:
-            writer.write(str(self._cached_last_cpu_time) + '\n')
+        submit_write(self._write_cputime, self._cached_last_cpu_time)
         self.log_handler.debug(f"DISPATCHEE={self.trace_pid}: update CPUTIME {self._cached_last_cpu_time} SUCCESS")
+
+    def _write_cputime(self, cpu_time: float):
+        """
+        Executed in writer thread.
+        """
+        with open(self._cputime_filename, 'w') as writer:
+            writer.write(str(cpu_time) + '\n')
@@ -1,6 +1,7 @@
+from pid_monitor._dt_mvc.fastproc import get_stat, status_name
 from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
-from pid_monitor._dt_mvc.std_tracer import BaseProcessTracerThread, ProbeError
+from pid_monitor._dt_mvc.std_tracer import BaseProcessTracerThread
 
 __all__ = ("ProcessSTATTracerThread",)
 
@@ -28,9 +29,7 @@ class ProcessSTATTracerThread(BaseProcessTracerThread):
         )
 
     def probe(self):
-        stat = self._process.status()
-        if stat is None:
-            raise ProbeError(f"TRACEE={self.trace_pid}: STAT returns None!")
+        stat = status_name(get_stat(self.trace_pid, self.pmc.backend_refresh_interval).state)
         self.frontend_cache.stat = stat
         self._appender.append([
             self.get_timestamp(),
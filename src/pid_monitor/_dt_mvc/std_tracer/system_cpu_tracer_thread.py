@@ -1,42 +1,88 @@
-import threading
-import time
-from statistics import mean
-from typing import List
+from typing import List, Dict, Tuple, TextIO, Optional, Set
 
-import psutil
+import numpy as np
 
-from pid_monitor._dt_mvc.appender import BaseTableAppender
-from pid_monitor._dt_mvc.frontend_cache.process_frontend_cache import ProcessFrontendCache
 from pid_monitor._dt_mvc.frontend_cache.system_frontend_cache import SystemFrontendCache
 from pid_monitor._dt_mvc.pm_config import PMConfig
-from pid_monitor._dt_mvc.std_tracer import BaseSystemTracerThread
+from pid_monitor._dt_mvc.std_tracer import BaseSystemTracerThread, ProbeError
 
 __all__ = ("SystemCPUTracerThread",)
 
+_SYSTEM_CPU_PROBE_INTERVAL = 1.0
+"""Interval used to calculate CPU utilization"""
 
-class AsyncSystemCPUProbeThread(threading.Thread):
-    appender: BaseTableAppender
+_PROC_STAT_PATH = "/proc/stat"
 
-    def __init__(self, appender: BaseTableAppender, frontend_cache: ProcessFrontendCache):
-        super().__init__()
-        self.appender = appender
-        self.frontend_cache = frontend_cache
 
-    def run(self):
-        cpu_percents: List[float] = psutil.cpu_percent(interval=1, percpu=True)
-        if cpu_percents is None:
-            return
-        self.frontend_cache.cpu_percent = mean(cpu_percents)
-        cpu_value_array = [time.time()]
-        cpu_value_array.extend(cpu_percents)
-        self.appender.append(cpu_value_array)
+_ALL_CORES = -1
+"""Key of the aggregated ``cpu`` line of ``/proc/stat``"""
+
+
+def _parse_proc_stat(proc_stat: str, cores: Optional[Set[int]] = None) -> Dict[int, Tuple[int, int]]:
+    """
+    Parse CPU lines of ``/proc/stat``.
+
+    :param cores: Cores to parse. ``None`` for all. The aggregated line is always parsed.
+    :return: Dict[core, (busy_jiffies, total_jiffies)], with the aggregated line as :py:data:`_ALL_CORES`.
+        Fields counted are user, nice, system, idle, iowait, irq, softirq and steal,
+        in which idle and iowait are not busy.
+    """
+    retd = {}
+    for line in proc_stat.splitlines():
+        if not line.startswith("cpu"):
+            if retd:
+                break  # CPU lines are at the beginning
+            continue
+        fields = line.split(maxsplit=9)
+        if fields[0] == "cpu":
+            core = _ALL_CORES
+        else:
+            core = int(fields[0][3:])
+            if cores is not None and core not in cores:
+                continue
+        times = list(map(int, fields[1:9]))
+        total = sum(times)
+        retd[core] = (total - times[3] - times[4], total)
+    return retd
+
+
+def _to_jiffies_array(snapshot: Dict[int, Tuple[int, int]], cores: List[int]) -> np.ndarray:
+    """
+    Arrange a snapshot into an array of shape ``(len(cores), 2)`` of busy and total jiffies.
+
+    Cores missing from the snapshot (i.e., went offline) are filled with NaN.
+    """
+    nan_pair = (np.nan, np.nan)
+    return np.array([snapshot.get(core, nan_pair) for core in cores], dtype=np.float64)
+
+
+def _get_percents(jiffies: np.ndarray, last_jiffies: np.ndarray) -> np.ndarray:
+    """
+    Busy percentage of each row, rounded to 1 decimal.
+    Rows with offline cores or no elapsed jiffies are 0.
+    """
+    delta = jiffies - last_jiffies
+    busy_delta = np.maximum(delta[:, 0], 0)
+    total_delta = delta[:, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percents = busy_delta / total_delta * 100
+    return np.where(total_delta > 0, percents, 0.0).round(1)
 
 
 class SystemCPUTracerThread(BaseSystemTracerThread):
     """
-    System-level CPU utilization tracer, traces CPU utilization of all logical cores.
+    System-level CPU utilization tracer, traces CPU utilization of all logical cores,
+    or cores specified by :py:attr:`PMConfig.cpu_poll_indices`.
     """
 
+    _proc_stat_reader: TextIO
+    _last_jiffies: Optional[np.ndarray]
+    """Jiffies of the last probe. :py:obj:`None` before the first probe"""
+    _cores: List[int]
+    _core_set: Set[int]
+    _rows: List[int]
+    """:py:data:`_ALL_CORES` followed by :py:attr:`_cores`"""
+
     def __init__(
             self,
             trace_pid: int,
@@ -48,16 +94,45 @@ class SystemCPUTracerThread(BaseSystemTracerThread):
             pmc=pmc,
             frontend_cache=frontend_cache
         )
+        self._proc_stat_reader = open(_PROC_STAT_PATH, "rt")
+        snapshot = _parse_proc_stat(self._proc_stat_reader.read())
+        self._cores = sorted(core for core in snapshot.keys() if core != _ALL_CORES)
+        if self.pmc.cpu_poll_indices is not None:
+            cpu_poll_indices = set(self.pmc.cpu_poll_indices)
+            offline_cores = sorted(cpu_poll_indices.difference(self._cores))
+            if offline_cores:
+                self.log_handler.warning(f"SYSTEM: Cores {offline_cores} are offline and will not be traced!")
+            self._cores = [core for core in self._cores if core in cpu_poll_indices]
+        self._core_set = set(self._cores)
+        self._rows = [_ALL_CORES, *self._cores]
+        self._last_jiffies = None
         cpu_name_array = ['TIME']
-        cpu_name_array.extend(map(str, range(psutil.cpu_count())))
+        cpu_name_array.extend(map(str, self._cores))
         self._init_setup_hook(
             tracer_type="cpu",
             table_appender_header=cpu_name_array
         )
+        self.probe_interval = _SYSTEM_CPU_PROBE_INTERVAL
 
     def probe(self):
-        acp = AsyncSystemCPUProbeThread(
-            appender=self._appender,
-            frontend_cache=self.frontend_cache
-        )
-        acp.start()
+        self._proc_stat_reader.seek(0)
+        snapshot = _parse_proc_stat(self._proc_stat_reader.read(), self._core_set)
+        if _ALL_CORES not in snapshot:
+            raise ProbeError("SYSTEM: No CPU found in /proc/stat!")
+        jiffies = _to_jiffies_array(snapshot, self._rows)
+        if self._last_jiffies is None:
+            # Nothing to compare with, so the first probe only records a baseline
+            self._last_jiffies = jiffies
+            return
+        cpu_percents = _get_percents(jiffies, self._last_jiffies).tolist()
+        self._last_jiffies = jiffies
+        self.frontend_cache.cpu_percent = cpu_percents[0]
+        cpu_value_array = [self.get_timestamp()]
+        cpu_value_array.extend(cpu_percents[1:])
+        self._appender.append(cpu_value_array)
+
+    def run_body(self):
+        try:
+            super().run_body()
+        finally:
+            self._proc_stat_reader.close()
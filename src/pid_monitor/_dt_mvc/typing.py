@@ -1,4 +1,5 @@
 import logging
+import os
 import threading
 import time
 
@@ -23,6 +24,20 @@ class ThreadWithPMC(threading.Thread):
         self.should_exit = False
         self.log_handler = logging.getLogger()
 
+    def pin_to_monitor_cpu(self):
+        """
+        Pin calling thread to :py:attr:`PMConfig.monitor_cpu`.
+        Threads created afterwards by this thread inherit the affinity.
+        """
+        if self.pmc.monitor_cpu is None or self.pmc.monitor_cpu < 0:
+            return
+        try:
+            os.sched_setaffinity(0, {self.pmc.monitor_cpu})
+        except (AttributeError, OSError, ValueError) as e:
+            self.log_handler.warning(
+                f"trace_pid={self.trace_pid}: Failed to pin to CPU {self.pmc.monitor_cpu}: {e.__class__.__name__}"
+            )
+
     def get_timestamp(self):
         """
         Get timestamp in an accuracy of 0.01 seconds.
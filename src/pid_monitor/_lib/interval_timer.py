@@ -0,0 +1,143 @@
+"""
+Helper for periodic loops that fire on an absolute cadence.
+
+On GNU/Linux, a ``timerfd`` with ``CLOCK_MONOTONIC`` is used,
+so that the period does not drift with the time spent in loop body.
+At most :py:data:`_MAX_TIMERFDS` timers hold a ``timerfd`` at the same time,
+so that tracing many processes does not exhaust file descriptors.
+Other timers, or timers on other systems, will fall back to :py:func:`time.sleep` towards an absolute deadline.
+"""
+import ctypes
+import ctypes.util
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+__all__ = ['IntervalTimer']
+
+_CLOCK_MONOTONIC = 1
+_TFD_CLOEXEC = 0o2000000
+
+_MAX_TIMERFDS = 32
+"""Maximum number of ``timerfd`` held by all :py:class:`IntervalTimer` of this process"""
+
+_N_TIMERFDS = 0
+_N_TIMERFDS_MUTEX = threading.Lock()
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.timerfd_create.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.timerfd_create.restype = ctypes.c_int
+        libc.timerfd_settime.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(_Itimerspec),
+            ctypes.POINTER(_Itimerspec)
+        ]
+        libc.timerfd_settime.restype = ctypes.c_int
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_LIBC = _load_libc()
+
+
+def _to_timespec(seconds: float) -> _Timespec:
+    sec = int(seconds)
+    nsec = int(round((seconds - sec) * 1e9))
+    if nsec == 0 and sec == 0:
+        nsec = 1  # A zero it_value disarms the timer
+    return _Timespec(sec, nsec)
+
+
+def _acquire_timerfd_slot() -> bool:
+    global _N_TIMERFDS
+    with _N_TIMERFDS_MUTEX:
+        if _N_TIMERFDS >= _MAX_TIMERFDS:
+            return False
+        _N_TIMERFDS += 1
+        return True
+
+
+def _release_timerfd_slot():
+    global _N_TIMERFDS
+    with _N_TIMERFDS_MUTEX:
+        _N_TIMERFDS -= 1
+
+
+class IntervalTimer:
+    """
+    A periodic timer. Call :py:func:`wait` at the end of each loop body.
+
+    Missed ticks are accumulated by the kernel and consumed in one :py:func:`wait`,
+    so a slow loop body will not shift later ticks.
+    """
+
+    interval: float
+    _fd: int
+    _next_deadline: float
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._fd = -1
+        self._next_deadline = time.monotonic() + interval
+        if _LIBC is None or not _acquire_timerfd_slot():
+            return
+        fd = _LIBC.timerfd_create(_CLOCK_MONOTONIC, _TFD_CLOEXEC)
+        if fd < 0:
+            _release_timerfd_slot()
+            return
+        spec = _Itimerspec(_to_timespec(interval), _to_timespec(interval))
+        if _LIBC.timerfd_settime(fd, 0, ctypes.byref(spec), None) != 0:
+            os.close(fd)
+            _release_timerfd_slot()
+            return
+        self._fd = fd
+
+    def wait(self) -> int:
+        """
+        Block until next tick.
+
+        :return: Number of ticks elapsed since last call.
+        """
+        if self._fd >= 0:
+            return int.from_bytes(os.read(self._fd, 8), byteorder=sys.byteorder)
+        now = time.monotonic()
+        if now < self._next_deadline:
+            time.sleep(self._next_deadline - now)
+            self._next_deadline += self.interval
+            return 1
+        ticks = int((now - self._next_deadline) // self.interval) + 1
+        self._next_deadline += ticks * self.interval
+        return ticks
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            _release_timerfd_slot()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except (AttributeError, OSError):
+            pass
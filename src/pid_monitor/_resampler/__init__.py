@@ -2,58 +2,160 @@
 WARNING! This file is subject to change.
 """
 
+import concurrent.futures
 import glob
+import gzip
 import logging
+import lzma
 import math
-import multiprocessing
 import os
-import queue
 import re
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, List, Dict, BinaryIO
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import tqdm
 import seaborn as sns
 
-from pid_monitor._lib import parallel_helper
+
+_TAIL_WINDOW_SIZE = 4096
+"""Initial number of bytes read from the end of a file when looking for its last line"""
+
+
+def _read_last_line(reader: BinaryIO) -> bytes:
+    """
+    Read the last non-empty line of a seekable file, without reading the entire file.
+    """
+    reader.seek(0, os.SEEK_END)
+    size = reader.tell()
+    window = _TAIL_WINDOW_SIZE
+    while True:
+        start = max(0, size - window)
+        reader.seek(start)
+        lines = [line for line in reader.read(size - start).split(b"\n") if line.strip()]
+        # The last line is complete only if a newline precedes it inside the window
+        if start == 0 or len(lines) >= 2:
+            return lines[-1] if lines else b""
+        window *= 2
+
+
+def _read_first_and_last_line(path: str) -> Tuple[bytes, bytes, bytes]:
+    """
+    :return: Header, first line of body and last line of body.
+    """
+    if path.endswith(".gz") or path.endswith(".xz"):
+        # Compressed streams cannot be seeked cheaply; scan lines without parsing them.
+        opener = gzip.open if path.endswith(".gz") else lzma.open
+        with opener(path, "rb") as reader:
+            header = reader.readline()
+            first_line = reader.readline()
+            last_line = first_line
+            for line in reader:
+                if line.strip():
+                    last_line = line
+        return header, first_line, last_line
+    with open(path, "rb") as reader:
+        header = reader.readline()
+        first_line = reader.readline()
+        last_line = _read_last_line(reader)
+    return header, first_line, last_line
+
+
+def _get_first_and_last_timestamp_from_an_arrow_file(path: str) -> Optional[Tuple[float, float]]:
+    """
+    Only the first and the last record batch are read.
+    """
+    with pa.OSFile(path) as reader:
+        arrow_reader = pa.ipc.open_file(reader)
+        if arrow_reader.num_record_batches == 0:
+            return None
+        first_batch = arrow_reader.get_batch(0)
+        last_batch = arrow_reader.get_batch(arrow_reader.num_record_batches - 1)
+        if first_batch.num_rows == 0 or last_batch.num_rows == 0:
+            return None
+        return (
+            first_batch.column("TIME")[0].as_py(),
+            last_batch.column("TIME")[-1].as_py()
+        )
 
 
 def get_first_and_last_timestamp_from_a_file(path: str) -> Optional[Tuple[float, float]]:
     _lh = logging.getLogger()
     _lh.debug(f"Parsing {path}")
-    retd_start = None
-    retd_end = None
-    df: pd.DataFrame
+    if path.endswith(".arrow"):
+        try:
+            retd = _get_first_and_last_timestamp_from_an_arrow_file(path)
+        except (OSError, KeyError, pa.ArrowException) as e:
+            _lh.error(f"Parsing {path} error: {e}")
+            return None
+        if retd is None:
+            _lh.error(f"Parsing {path} error: File is empty?")
+        else:
+            _lh.debug(f"Parsing {path} FIN")
+        return retd
     try:
-        for df in pd.read_table(path, chunksize=1000):
-            if retd_start is None:
-                retd_start = df['TIME'].iloc[0]
-            retd_end = df['TIME'].iloc[-1]
-    except (KeyError, IndexError) as e:
-        _lh.error(f"Parsing {path} error: {e} File is empty?")
-        return None
-    except pd.errors.ParserError as e:
+        header, first_line, last_line = _read_first_and_last_line(path)
+    except (OSError, EOFError) as e:
         _lh.error(f"Parsing {path} error: {e}")
         return None
-    if retd_start is not None:
-        _lh.debug(f"Parsing {path} FIN")
-        return retd_start, retd_end
-    else:
+    if not first_line.strip():
         _lh.error(f"Parsing {path} error: File is empty?")
         return None
+    try:
+        time_index = header.rstrip(b"\r\n").split(b"\t").index(b"TIME")
+        retd_start = float(first_line.rstrip(b"\r\n").split(b"\t")[time_index])
+        retd_end = float(last_line.rstrip(b"\r\n").split(b"\t")[time_index])
+    except (ValueError, IndexError) as e:
+        _lh.error(f"Parsing {path} error: {e}")
+        return None
+    _lh.debug(f"Parsing {path} FIN")
+    return retd_start, retd_end
 
 
-class GetFirstAndLastTimestampFromAFileProcess(multiprocessing.Process):
-    def __init__(self, path: str, result_queue: multiprocessing.Queue):
-        super().__init__()
-        self.path = path
-        self.result_queue = result_queue
+def _seconds_to_ns(seconds: np.ndarray) -> np.ndarray:
+    return np.round(seconds * 1e9).astype(np.int64)
+
+
+def _bfill_positions_numpy(src_ts: np.ndarray, dst_ts: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """
+    For each ``dst_ts[lo:hi + 1]``, find position of the first ``src_ts`` that is not earlier than it.
+
+    :param src_ts: Sorted source timestamps in ns.
+    :param dst_ts: Sorted destination timestamps in ns.
+    :return: Positions in ``src_ts`` for each ``dst_ts``, -1 for missing.
+    """
+    retd = np.full(dst_ts.shape[0], -1, dtype=np.int64)
+    if lo > hi:
+        return retd
+    positions = np.searchsorted(src_ts, dst_ts[lo:hi + 1], side="left")
+    positions[positions >= src_ts.shape[0]] = -1
+    retd[lo:hi + 1] = positions
+    return retd
 
-    def run(self) -> None:
-        self.result_queue.put(
-            get_first_and_last_timestamp_from_a_file(self.path)
-        )
+
+try:
+    from numba import njit
+
+
+    @njit(cache=True)
+    def _bfill_positions(src_ts: np.ndarray, dst_ts: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """
+        Merge-style implementation of :py:func:`_bfill_positions_numpy`.
+        """
+        retd = np.full(dst_ts.shape[0], -1, dtype=np.int64)
+        n_src = src_ts.shape[0]
+        i = 0
+        for j in range(lo, hi + 1):
+            while i < n_src and src_ts[i] < dst_ts[j]:
+                i += 1
+            if i == n_src:
+                break
+            retd[j] = i
+        return retd
+except ImportError:
+    _bfill_positions = _bfill_positions_numpy
 
 
 class ResamplerConfig:
@@ -61,6 +163,8 @@ class ResamplerConfig:
     time_start: pd.Timestamp
     time_end: pd.Timestamp
     index: pd.DatetimeIndex
+    index_i8: np.ndarray
+    """:py:attr:`index` as nanoseconds since epoch"""
 
     def __init__(
             self,
@@ -77,6 +181,8 @@ class ResamplerConfig:
             end=self.time_end + 2 * self.interval,
             freq=self.interval
         )
+        # Not DatetimeIndex.asi8, which is not in nanoseconds for non-ns units
+        self.index_i8 = self.index.values.astype("datetime64[ns]").view(np.int64)
 
     @classmethod
     def from_dir(
@@ -88,31 +194,21 @@ class ResamplerConfig:
     ):
         new_instance_start = math.inf
         new_instance_end = -math.inf
-        files_needed_to_be_parsed = list(glob.glob(os.path.join(output_basename, file_mask)))
-        manager = multiprocessing.Manager()
-        result_queue = manager.Queue()
-        pool = parallel_helper.ParallelJobQueue("Parsing...", refresh_interval=0, pool_size=1000)
-        for path in files_needed_to_be_parsed:
-            if path.find("sys") != -1:
-                continue
-            if path.find("resampled") != -1:
-                continue
-            if path.find("final") != -1:
-                continue
-            pool.append(GetFirstAndLastTimestampFromAFileProcess(path, result_queue))
-        pool.start()
-        while not pool.all_finished:
-            try:
-                this_time_start_end = result_queue.get(timeout=0.1)
-            except (TimeoutError, queue.Empty):
-                continue
-            if this_time_start_end is None:
-                continue
-            else:
+        files_needed_to_be_parsed = [
+            path
+            for path in glob.glob(os.path.join(output_basename, file_mask))
+            if path.find("sys") == -1 and path.find("resampled") == -1 and path.find("final") == -1
+        ]
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for this_time_start_end in tqdm.tqdm(
+                    executor.map(get_first_and_last_timestamp_from_a_file, files_needed_to_be_parsed),
+                    desc="Parsing...",
+                    total=len(files_needed_to_be_parsed)
+            ):
+                if this_time_start_end is None:
+                    continue
                 new_instance_start = min(new_instance_start, this_time_start_end[0])
                 new_instance_end = max(new_instance_end, this_time_start_end[1])
-        pool.join()
-        manager.shutdown()
         if new_instance_start is math.inf or new_instance_end is math.inf:
             raise ValueError(f"Failed to get valid start/end time from {output_basename}")
         new_instance = cls(
@@ -141,64 +237,62 @@ class BaseResampler:
 
     def resample(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        The Default resampler will resample all data
+        The Default resampler will resample all data.
+
+        Each point of the index inside the time span of ``df`` takes the first row at or after it (back-fill),
+        while points outside are filled with NaN.
         """
-        df['TIME'] = pd.to_datetime(df['TIME'], unit="s")
-        if df.shape[0] == 0:
-            df = df.set_index('TIME').reindex(self.rsc.index, method="bfill").reset_index(drop=False)
+        time_ns = _seconds_to_ns(df['TIME'].to_numpy(dtype=np.float64))
+        df = df.drop('TIME', axis=1)
+        index_ns = self.rsc.index_i8
+        if time_ns.shape[0] == 0:
+            positions = np.full(index_ns.shape[0], -1, dtype=np.int64)
         else:
-            df = df.sort_values(by=['TIME'])
-            df_time_start = df['TIME'][0]
-            df_time_end = df['TIME'].iloc[-1]
-
-            df_scale_start = self.rsc.index.array[self.rsc.index.array.searchsorted(df_time_start, side="right")]
-            df_scale_end = self.rsc.index.array[self.rsc.index.array.searchsorted(df_time_end, side="left")]
-            phase1_scale_index = pd.date_range(
-                start=df_scale_start,
-                end=df_scale_end,
-                freq=self.rsc.interval
-            )
-            df = (
-                df
-                .set_index('TIME')
-                .reindex(phase1_scale_index, method="bfill")
-                .reindex(self.rsc.index)
-                .reset_index(drop=False)
-            )
-        df['TIME'] = (df['index'] - pd.Timestamp("1970-01-01")) / pd.Timedelta("1s")
-        df = df.drop('index', axis=1)
-        # print(dict(df.dtypes))
-        # print(df.head(2))
-        # exit()
-
+            order = np.argsort(time_ns, kind="stable")
+            time_ns = time_ns[order]
+            df = df.iloc[order]
+            df_scale_start = np.searchsorted(index_ns, time_ns[0], side="right")
+            # The last sample may be later than the last point of index
+            df_scale_end = min(np.searchsorted(index_ns, time_ns[-1], side="left"), index_ns.shape[0] - 1)
+            positions = _bfill_positions(time_ns, index_ns, df_scale_start, df_scale_end)
+        df = df.reset_index(drop=True).reindex(positions).reset_index(drop=True)
+        df['TIME'] = index_ns / 1e9
         return df
 
 
-def aggregate_using_sum(output_basename: str, file_mask: str):
+_MEMORY_FIELDS = ("VIRT", "RESIDENT", "SHARED", "TEXT", "DATA", "SWAP")
+"""Fields of memory tracer, in bytes"""
+
+
+def _downcast_memory_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast memory fields present in ``df`` to the smallest integer type that holds all their values.
+    Other fields, like percentages, are kept as-is.
+
+    Memory fields are in bytes, so the width is decided by values instead of being fixed to 32 bits.
+    Should be called after NaN are filled.
+    """
+    for name in _MEMORY_FIELDS:
+        if name in df.columns:
+            df[name] = pd.to_numeric(df[name].astype(np.int64), downcast="integer")
+    return df
+
+
+def aggregate_using_sum(output_basename: str, file_mask: str) -> Optional[pd.DataFrame]:
+    """
+    Sum all fields of resampled files over ``TIME``,
+    with ``NPROC`` as number of processes whose first field is non-zero on that time.
+    """
     files_needed_to_be_parsed = list(glob.glob(os.path.join(output_basename, file_mask)))
-    full_df = None
-    full_df_names = []
+    parts: List[pd.DataFrame] = []
 
     for path in tqdm.tqdm(files_needed_to_be_parsed, desc="Aggregating..."):
-        df = pd.read_parquet(path).set_index("TIME").fillna(value=0)
-        # print(df.head(2))
-        if full_df is None:
-            full_df = df
-            full_df_names = full_df.columns
-            full_df = full_df.assign(NPROC=0)
-        else:
-            # print(full_df.head(2))
-            # print(list(df.index.array))
-            for time in full_df.index.array:
-                if df.loc[time, full_df_names[0]] != 0:
-                    full_df.loc[time, "NPROC"] += 1
-            full_df = full_df.join(df, on="TIME", lsuffix="_L", rsuffix="_R")
-            # print(full_df.shape)
-            for name in full_df_names:
-                full_df[name] = full_df[[f"{name}_L", f"{name}_R"]].sum(axis=1)
-                full_df = full_df.drop([f"{name}_R", f"{name}_L"], axis=1)
-                # print(full_df.dtypes.keys())
-    return full_df
+        df = _downcast_memory_fields(pd.read_parquet(path).set_index("TIME").fillna(value=0))
+        parts.append(df.assign(NPROC=(df.iloc[:, 0] != 0).astype(np.int8)))
+    if not parts:
+        return None
+    # Integer sums are accumulated in 64 bits, so narrow parts do not overflow.
+    return pd.concat(parts).groupby(level=0, sort=False).sum()
 
 
 def plot_aggregation_figure(output_basename: str, file_mask: str, col_name: str, out_filename: str):
@@ -220,52 +314,83 @@ def plot_aggregation_figure(output_basename: str, file_mask: str, col_name: str,
 
 
 
+_TRACE_FILE_EXTENSIONS = (".tsv.gz", ".arrow")
+
+
+def read_trace_file(path: str) -> pd.DataFrame:
+    """
+    Read a table written by either :py:class:`LZ77TSVTableAppender` or :py:class:`ArrowTableAppender`.
+    """
+    if path.endswith(".arrow"):
+        with pa.OSFile(path) as reader:
+            return pa.ipc.open_file(reader).read_pandas()
+    return pd.read_csv(path, delimiter="\t", engine="pyarrow")
+
+
+def _get_resampled_path(path: str) -> str:
+    for extension in _TRACE_FILE_EXTENSIONS:
+        if path.endswith(extension):
+            return path[:-len(extension)] + ".resampled.parquet"
+    return path + ".resampled.parquet"
+
+
+def _resample_one(path: str, rsc: ResamplerConfig, keepfield: List[str]) -> None:
+    """
+    Resample one file to ``*.resampled.parquet``, keeping ``TIME`` and fields in ``keepfield``.
+    """
+    df = read_trace_file(path)
+    df = df.drop([field for field in df.columns if field not in keepfield and field != "TIME"], axis=1)
+    (
+        BaseResampler(rsc)
+        .resample(df)
+        .to_parquet(_get_resampled_path(path))
+    )
+
+
 def parallel_resample(
         output_basename: str,
         rsc: ResamplerConfig,
         file_mask: str,
         keepfield: List[str]
 ):
-    class ResampleProcess(multiprocessing.Process):
-        def __init__(self, _rsc: ResamplerConfig, _path: str, _keepfield: List[str]):
-            super().__init__()
-            self.rsc = _rsc
-            self.path = _path
-            self.keepfield = _keepfield
-            self.keepfield.append("TIME")
-
-        def run(self) -> None:
-            df = pd.read_csv(self.path, delimiter="\t", engine="pyarrow")
-            for field in df.columns:
-                if field not in self.keepfield:
-                    df = df.drop(field, axis=1)
-            (
-                BaseResampler(self.rsc)
-                .resample(df)
-                .to_parquet(self.path.replace(".tsv.gz", ".resampled.parquet"))
-            )
-
-    files_needed_to_be_parsed = list(glob.glob(os.path.join(output_basename, file_mask)))
-    pool = parallel_helper.ParallelJobQueue(pool_name="Resampling", refresh_interval=0, pool_size=1000)
-    for path in files_needed_to_be_parsed:
-        if path.find("sys") != -1:
-            continue
-        pool.append(ResampleProcess(rsc, path, keepfield))
-    pool.start()
-    pool.join()
+    files_needed_to_be_parsed = [
+        path
+        for path in glob.glob(os.path.join(output_basename, file_mask))
+        if path.find("sys") == -1
+    ]
+    _lh = logging.getLogger()
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = {
+            executor.submit(_resample_one, path, rsc, keepfield): path
+            for path in files_needed_to_be_parsed
+        }
+        for future in tqdm.tqdm(
+                concurrent.futures.as_completed(futures),
+                desc="Resampling",
+                total=len(futures)
+        ):
+            try:
+                future.result()
+            except Exception as e:
+                # A truncated or corrupted trace only loses its own file
+                _lh.error(f"Resampling {futures[future]} error: {e.__class__.__name__} {e}")
 
 
-def total_process(output_basename: str):
+def total_process(output_basename: str, file_extension: str = ".tsv.gz"):
+    """
+    :param file_extension: ``.tsv.gz`` for :py:class:`LZ77TSVTableAppender`
+        or ``.arrow`` for :py:class:`ArrowTableAppender`.
+    """
     # print(output_basename)
     rsc = ResamplerConfig.from_dir(
         output_basename=output_basename,
         interval=1,
         round_to_demical=0,
-        file_mask="*.tsv.gz"
+        file_mask=f"*{file_extension}"
     )
-    parallel_resample(output_basename, rsc, "*.mem.tsv.gz", keepfield=["VIRT", "RESIDENT"])
-    parallel_resample(output_basename, rsc, "*.cpu.tsv.gz", keepfield=["CPU_PERCENT"])
-    parallel_resample(output_basename, rsc, "*.nfd.tsv.gz", keepfield=["N_FD"])
+    parallel_resample(output_basename, rsc, f"*.mem{file_extension}", keepfield=["VIRT", "RESIDENT"])
+    parallel_resample(output_basename, rsc, f"*.cpu{file_extension}", keepfield=["CPU_PERCENT"])
+    parallel_resample(output_basename, rsc, f"*.nfd{file_extension}", keepfield=["N_FD"])
 
     full_df_mem = aggregate_using_sum(output_basename, "*.mem.resampled.parquet")
     full_df_cpu = aggregate_using_sum(output_basename, "*.cpu.resampled.parquet")
@@ -325,7 +450,6 @@ if __name__ == '__main__':
         # '/home/yuzj/Desktop/profiler2/proc_profiler_sh_f9132cfd-50f5-47e1-af82-41cf17a8e069'
     ]
 
-    # pool = parallel_helper.ParallelJobQueue()
     for output_basename in flist:
         print(output_basename)
         total_process(output_basename)
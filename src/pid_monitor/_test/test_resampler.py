@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from pid_monitor import _resampler
+from pid_monitor._resampler import BaseResampler, ResamplerConfig
+
+
+def _brute_force_bfill(time_s: np.ndarray, values: np.ndarray, index_s: np.ndarray) -> np.ndarray:
+    retd = np.full(index_s.shape[0], np.nan)
+    for j, point in enumerate(index_s):
+        if point <= time_s[0] or point > time_s[-1]:
+            continue
+        retd[j] = values[np.argmax(time_s >= point)]
+    return retd
+
+
+def _run_resample(time_s: np.ndarray) -> None:
+    rsc = ResamplerConfig(interval=1, time_start=100, time_end=110, round_to_demical=0)
+    values = np.arange(time_s.shape[0], dtype=np.float64)
+    df = BaseResampler(rsc).resample(pd.DataFrame({"TIME": time_s, "VALUE": values}))
+    index_s = rsc.index_i8 / 1e9
+    np.testing.assert_array_equal(df["TIME"].to_numpy(), index_s)
+    np.testing.assert_array_equal(df["VALUE"].to_numpy(), _brute_force_bfill(time_s, values, index_s))
+
+
+def test_last_sample_after_index():
+    _run_resample(np.array([100.5, 104.2, 111.7, 120.0]))
+
+
+def test_last_sample_after_index_kernel_bounds(monkeypatch):
+    """The numba kernel does not check bounds, so ``hi`` must be a valid position of index."""
+
+    def checked_bfill_positions(src_ts, dst_ts, lo, hi):
+        assert 0 <= lo and hi < dst_ts.shape[0]
+        return _resampler._bfill_positions_numpy(src_ts, dst_ts, lo, hi)
+
+    monkeypatch.setattr(_resampler, "_bfill_positions", checked_bfill_positions)
+    _run_resample(np.array([100.5, 104.2, 111.7, 120.0]))
+
+
+def test_samples_inside_index():
+    _run_resample(np.array([101.0, 102.5, 105.0, 108.3]))
@@ -2,15 +2,15 @@
 This module generates R reports.
 """
 
+import concurrent.futures
 import logging
 import os
 import subprocess
-import threading
 from typing import Set
 
-from pid_monitor._private import DEFAULT_SYSTEM_INDICATOR_PID
+import tqdm
 
-from pid_monitor._lib import parallel_helper
+from pid_monitor._dt_mvc import DEFAULT_SYSTEM_INDICATOR_PID
 
 _LOG_HANDLER = logging.getLogger()
 """The Logger Handler"""
@@ -25,60 +25,66 @@ _RENV_CWD = os.path.dirname(os.path.dirname(_FILE_DIR))
 """Directory of renv, used for calling R processes"""
 
 
-class _MakeIndividualReportThread(threading.Thread):
-    def __init__(self, this_pid: int, output_basename: str):
-        super().__init__()
-        self.this_pid = this_pid
-        self.output_basename = output_basename
-        self.logger = logging.getLogger()
-
-    def run(self) -> None:
-        if self.this_pid == DEFAULT_SYSTEM_INDICATOR_PID:
-            log_filename = f'{self.output_basename}_report_system.log'
-        else:
-            log_filename = f'{self.output_basename}_report_{self.this_pid}.log'
-        log_writer = open(log_filename, "wt")
-        if self.this_pid == DEFAULT_SYSTEM_INDICATOR_PID:
-            report_process = subprocess.Popen((
-                'Rscript',
-                os.path.join(_R_FILE_DIR, 'make_system_report.R'),
-                '--basename', self.output_basename,
-                '--rmd', os.path.join(_R_FILE_DIR, 'system_report.Rmd')
-            ),
-                cwd=_RENV_CWD,
-                stdout=log_writer,
-                stderr=log_writer
-            )
-        else:
-            report_process = subprocess.Popen((
-                'Rscript',
-                os.path.join(_R_FILE_DIR, 'make_process_report.R'),
-                '--pid', str(self.this_pid),
-                '--basename', self.output_basename,
-                '--rmd', os.path.join(_R_FILE_DIR, 'process_report.Rmd')
-            ),
-                cwd=_RENV_CWD,
-                stdout=log_writer,
-                stderr=log_writer
-            )
+def _make_individual_report(this_pid: int, output_basename: str) -> None:
+    """
+    Generate report for one PID, or for the system if ``this_pid`` is ``DEFAULT_SYSTEM_INDICATOR_PID``.
+    """
+    if this_pid == DEFAULT_SYSTEM_INDICATOR_PID:
+        log_filename = f'{output_basename}_report_system.log'
+    else:
+        log_filename = f'{output_basename}_report_{this_pid}.log'
+    log_writer = open(log_filename, "wt")
+    if this_pid == DEFAULT_SYSTEM_INDICATOR_PID:
+        report_process = subprocess.Popen((
+            'Rscript',
+            os.path.join(_R_FILE_DIR, 'make_system_report.R'),
+            '--basename', output_basename,
+            '--rmd', os.path.join(_R_FILE_DIR, 'system_report.Rmd')
+        ),
+            cwd=_RENV_CWD,
+            stdout=log_writer,
+            stderr=log_writer
+        )
+    else:
+        report_process = subprocess.Popen((
+            'Rscript',
+            os.path.join(_R_FILE_DIR, 'make_process_report.R'),
+            '--pid', str(this_pid),
+            '--basename', output_basename,
+            '--rmd', os.path.join(_R_FILE_DIR, 'process_report.Rmd')
+        ),
+            cwd=_RENV_CWD,
+            stdout=log_writer,
+            stderr=log_writer
+        )
 
-        self.logger.debug(f"{' '.join(report_process.args)} ADD")
-        retv = report_process.wait()
-        log_writer.close()
-        if retv == 0:
-            self.logger.debug(f"{' '.join(report_process.args)} FIN")
-            os.remove(log_filename)
-        else:
-            self.logger.error(f"{' '.join(report_process.args)} ERR")
+    _LOG_HANDLER.debug(f"{' '.join(report_process.args)} ADD")
+    retv = report_process.wait()
+    log_writer.close()
+    if retv == 0:
+        _LOG_HANDLER.debug(f"{' '.join(report_process.args)} FIN")
+        os.remove(log_filename)
+    else:
+        _LOG_HANDLER.error(f"{' '.join(report_process.args)} ERR")
 
 
 def make_all_report(all_pids: Set[int], output_basename: str):
     """
-    Generate all report for both system and process asynchronously
+    Generate all report for both system and process asynchronously,
+    with at most one Rscript process per CPU.
     """
-    parallel_job_queue = parallel_helper.ParallelJobQueue(pool_name="Compiling HTMLs")
-    for this_pid in all_pids:
-        parallel_job_queue.append(_MakeIndividualReportThread(this_pid=this_pid, output_basename=output_basename))
-    parallel_job_queue.start()
-    parallel_job_queue.join()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_make_individual_report, this_pid, output_basename)
+            for this_pid in all_pids
+        ]
+        for future in tqdm.tqdm(
+                concurrent.futures.as_completed(futures),
+                desc="Compiling HTMLs",
+                total=len(futures)
+        ):
+            try:
+                future.result()
+            except OSError as e:
+                _LOG_HANDLER.error(f"Report generation {e.__class__.__name__} encountered! DETAILS={e.__repr__()}")
     _LOG_HANDLER.info("All finished")